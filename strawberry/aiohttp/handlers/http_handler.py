@@ -23,6 +23,7 @@ class HTTPHandler:
         get_context,
         get_root_value,
         process_result,
+        encode_json,
         request: web.Request,
     ):
         self.schema = schema
@@ -31,6 +32,7 @@ class HTTPHandler:
         self.get_context = get_context
         self.get_root_value = get_root_value
         self.process_result = process_result
+        self.encode_json = encode_json
         self.request = request
 
     async def handle(self) -> web.StreamResponse:
@@ -95,7 +97,7 @@ class HTTPHandler:
             ) from e
 
         response_data = await self.process_result(request, result)
-        response.text = json.dumps(response_data)
+        response.text = self.encode_json(response_data)
         response.content_type = "application/json"
         return response
 
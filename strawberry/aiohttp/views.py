@@ -1,4 +1,5 @@
 import asyncio
+import json
 from datetime import timedelta
 
 from aiohttp import web
@@ -78,6 +79,7 @@ class GraphQLView:
                 get_context=self.get_context,
                 get_root_value=self.get_root_value,
                 process_result=self.process_result,
+                encode_json=self.encode_json,
                 request=request,
             ).handle()
 
@@ -93,3 +95,6 @@ class GraphQLView:
         self, request: web.Request, result: ExecutionResult
     ) -> GraphQLHTTPResponse:
         return process_result(result)
+
+    def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
+        return json.dumps(response_data)
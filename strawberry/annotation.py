@@ -19,6 +19,9 @@ except ImportError:  # pragma: no cover
     # ForwardRef is private in python 3.6 and 3.7
     from typing import _ForwardRef as ForwardRef  # type: ignore
 
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
 from strawberry.custom_scalar import ScalarDefinition
 from strawberry.enum import EnumDefinition
 from strawberry.lazy_type import LazyType
@@ -238,11 +241,8 @@ class StrawberryAnnotation:
         # this check is needed because unions declared with the new syntax `A | B`
         # don't have a `__origin__` property on them, but they are instances of
         # `UnionType`, which is only available in Python 3.10+
-        if sys.version_info >= (3, 10):
-            from types import UnionType
-
-            if isinstance(annotation, UnionType):
-                return True
+        if sys.version_info >= (3, 10) and isinstance(annotation, UnionType):
+            return True
 
         # unions declared as Union[A, B] fall through to this check, even on python 3.10+
 
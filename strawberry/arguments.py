@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import warnings
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,6 +11,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -30,6 +32,7 @@ from .unset import UNSET as _deprecated_UNSET, _deprecated_is_unset  # noqa
 
 if TYPE_CHECKING:
     from strawberry.schema.config import StrawberryConfig
+    from strawberry.schema.name_converter import NameConverter
 
 DEPRECATED_NAMES: Dict[str, str] = {
     "UNSET": (
@@ -115,6 +118,37 @@ class StrawberryArgument:
                 self.deprecation_reason = arg.deprecation_reason
 
 
+InputFields = List[Tuple[str, str, Union[StrawberryType, type]]]
+InputFieldsByType = Dict[type, InputFields]
+
+# (graphql name, python name, type) of the fields of each input type, per name
+# converter, so that the names aren't converted again for every input value
+_input_fields_cache: weakref.WeakKeyDictionary[
+    NameConverter, InputFieldsByType
+] = weakref.WeakKeyDictionary()
+
+
+def _get_input_fields(type_: type, name_converter: NameConverter) -> InputFields:
+    fields_by_type = _input_fields_cache.setdefault(name_converter, {})
+
+    try:
+        return fields_by_type[type_]
+    except KeyError:
+        pass
+
+    type_definition: TypeDefinition = type_._type_definition  # type: ignore
+
+    assert type_definition.is_input
+
+    input_fields = [
+        (name_converter.from_field(field), field.python_name, field.type)
+        for field in type_definition.fields
+    ]
+    fields_by_type[type_] = input_fields
+
+    return input_fields
+
+
 def convert_argument(
     value: object,
     type_: Union[StrawberryType, type],
@@ -147,22 +181,19 @@ def convert_argument(
         return convert_argument(value, type_.resolve_type(), scalar_registry, config)
 
     if hasattr(type_, "_type_definition"):  # TODO: Replace with StrawberryInputObject
-        type_definition: TypeDefinition = type_._type_definition  # type: ignore
-
-        assert type_definition.is_input
+        type_ = cast(type, type_)
+        value = cast(Mapping, value)
 
         kwargs = {}
 
-        for field in type_definition.fields:
-            value = cast(Mapping, value)
-            graphql_name = config.name_converter.from_field(field)
-
+        for graphql_name, python_name, field_type in _get_input_fields(
+            type_, config.name_converter
+        ):
             if graphql_name in value:
-                kwargs[field.python_name] = convert_argument(
-                    value[graphql_name], field.type, scalar_registry, config
+                kwargs[python_name] = convert_argument(
+                    value[graphql_name], field_type, scalar_registry, config
                 )
 
-        type_ = cast(type, type_)
         return type_(**kwargs)
 
     raise UnsupportedTypeError(type_)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Set, Union
+from typing import Iterable, List, Set, Union
 
 from graphql import GraphQLObjectType
 
@@ -84,7 +84,7 @@ class MissingArgumentsAnnotationsError(Exception):
 class WrongReturnTypeForUnion(Exception):
     """The Union type cannot be resolved because it's not a field"""
 
-    def __init__(self, field_name: str, result_type: str):
+    def __init__(self, field_name: str, result_type: type):
         message = (
             f'The type "{result_type}" cannot be resolved for the field "{field_name}" '
             ", are you using a strawberry.field?"
@@ -97,7 +97,10 @@ class UnallowedReturnTypeForUnion(Exception):
     """The return type is not in the list of Union types"""
 
     def __init__(
-        self, field_name: str, result_type: str, allowed_types: Set[GraphQLObjectType]
+        self,
+        field_name: str,
+        result_type: type,
+        allowed_types: Iterable[GraphQLObjectType],
     ):
         formatted_allowed_types = list(sorted(type_.name for type_ in allowed_types))
 
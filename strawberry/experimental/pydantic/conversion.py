@@ -1,6 +1,6 @@
 import copy
 import dataclasses
-from typing import Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from strawberry.enum import EnumDefinition
 from strawberry.field import StrawberryField
@@ -8,76 +8,146 @@ from strawberry.type import StrawberryList, StrawberryOptional, StrawberryType
 from strawberry.union import StrawberryUnion
 
 
-def _convert_from_pydantic_to_strawberry_type(
-    type_: Union[StrawberryType, type], data_from_model=None, extra=None
-):
-    data = data_from_model if data_from_model is not None else extra
+Converter = Callable[[Any, Any], Any]
+FieldConverters = List[Tuple[str, Converter]]
 
+
+def _convert_as_is(data_from_model: Any, extra: Any) -> Any:
+    return data_from_model if data_from_model is not None else extra
+
+
+def _build_converter(type_: Union[StrawberryType, type]) -> Converter:
+    """Builds a function that converts data for the given field type.
+
+    The type checks happen once here instead of on every converted value. The
+    returned function takes the data from the model and the extra data.
+    """
     if isinstance(type_, StrawberryOptional):
-        if data is None:
-            return data
-        return _convert_from_pydantic_to_strawberry_type(
-            type_.of_type, data_from_model=data, extra=extra
-        )
+        convert_of_type = _build_converter(type_.of_type)
+
+        def convert_optional(data_from_model: Any, extra: Any) -> Any:
+            data = data_from_model if data_from_model is not None else extra
+
+            if data is None:
+                return data
+
+            return convert_of_type(data, extra)
+
+        return convert_optional
+
     if isinstance(type_, StrawberryUnion):
+        union_converters: List[Tuple[type, Converter]] = []
+
         for option_type in type_.types:
             if hasattr(option_type, "_pydantic_type"):
                 source_type = option_type._pydantic_type  # type: ignore
             else:
                 source_type = cast(type, option_type)
-            if isinstance(data, source_type):
-                return _convert_from_pydantic_to_strawberry_type(
-                    option_type, data_from_model=data, extra=extra
+
+            union_converters.append((source_type, _build_converter(option_type)))
+
+        # the converter picked for a given runtime type, so that the isinstance
+        # scan over the union members only happens once per type
+        converters_by_type: Dict[type, Optional[Converter]] = {}
+
+        def convert_union(data_from_model: Any, extra: Any) -> Any:
+            data = data_from_model if data_from_model is not None else extra
+            data_type = type(data)
+
+            try:
+                convert_option = converters_by_type[data_type]
+            except KeyError:
+                convert_option = next(
+                    (
+                        convert
+                        for source_type, convert in union_converters
+                        if isinstance(data, source_type)
+                    ),
+                    None,
                 )
+                converters_by_type[data_type] = convert_option
+
+            if convert_option is None:
+                return data
+
+            return convert_option(data, extra)
+
+        return convert_union
+
     if isinstance(type_, EnumDefinition):
-        return data
+        return _convert_as_is
+
     if isinstance(type_, StrawberryList):
-        items = []
-        for index, item in enumerate(data):
-            items.append(
-                _convert_from_pydantic_to_strawberry_type(
-                    type_.of_type,
-                    data_from_model=item,
-                    extra=extra[index] if extra else None,
+        convert_item = _build_converter(type_.of_type)
+
+        def convert_list(data_from_model: Any, extra: Any) -> Any:
+            data = data_from_model if data_from_model is not None else extra
+
+            return [
+                convert_item(item, extra[index] if extra else None)
+                for index, item in enumerate(data)
+            ]
+
+        return convert_list
+
+    if hasattr(type_, "_type_definition"):
+        field_type = type_
+
+        def convert_object(data_from_model: Any, extra: Any) -> Any:
+            strawberry_type = field_type
+
+            # in the case of an interface, the concrete type may be more specific
+            # than the type in the field definition
+            # don't check _strawberry_input_type because inputs can't be interfaces
+            data = data_from_model if data_from_model is not None else extra
+            if hasattr(type(data), "_strawberry_type"):
+                strawberry_type = type(data)._strawberry_type
+            if hasattr(strawberry_type, "from_pydantic"):
+                return strawberry_type.from_pydantic(  # type: ignore
+                    data_from_model, extra
                 )
+            return convert_pydantic_model_to_strawberry_class(
+                strawberry_type, model_instance=data_from_model, extra=extra
             )
 
-        return items
+        return convert_object
 
-    if hasattr(type_, "_type_definition"):
-        # in the case of an interface, the concrete type may be more specific
-        # than the type in the field definition
-        # don't check _strawberry_input_type because inputs can't be interfaces
-        if hasattr(type(data), "_strawberry_type"):
-            type_ = type(data)._strawberry_type
-        if hasattr(type_, "from_pydantic"):
-            return type_.from_pydantic(data_from_model, extra)  # type: ignore
-        return convert_pydantic_model_to_strawberry_class(
-            type_, model_instance=data_from_model, extra=extra
-        )
+    return _convert_as_is
+
+
+def _get_field_converters(cls: type) -> FieldConverters:
+    # The converters are stored on the class itself, so that they are collected
+    # along with it. We read them from `__dict__` as subclasses need their own
+    cached = cls.__dict__.get("_pydantic_converters")
+    if cached is not None:
+        return cached
+
+    converters: FieldConverters = []
+
+    for field in cls._type_definition.fields:  # type: ignore
+        field = cast(StrawberryField, field)
 
-    return data
+        # only convert and add fields to kwargs if they are present in the `__init__`
+        # method of the class
+        if field.init:
+            converters.append((field.python_name, _build_converter(field.type)))
+
+    cls._pydantic_converters = converters  # type: ignore
+
+    return converters
 
 
 def convert_pydantic_model_to_strawberry_class(cls, *, model_instance=None, extra=None):
     extra = extra or {}
     kwargs = {}
 
-    for field in cls._type_definition.fields:
-        field = cast(StrawberryField, field)
-        python_name = field.python_name
-
+    for python_name, convert in _get_field_converters(cls):
         data_from_extra = extra.get(python_name, None)
         data_from_model = (
             getattr(model_instance, python_name, None) if model_instance else None
         )
 
-        # only convert and add fields to kwargs if they are present in the `__init__`
-        # method of the class
-        if field.init:
-            kwargs[python_name] = _convert_from_pydantic_to_strawberry_type(
-                field.type, data_from_model, extra=data_from_extra
-            )
+        kwargs[python_name] = convert(data_from_model, data_from_extra)
 
     return cls(**kwargs)
 
@@ -4,7 +4,7 @@ from typing import Any, List, NamedTuple, NoReturn, Set, Tuple, Type, Union, cas
 from pydantic import BaseModel
 from pydantic.fields import ModelField
 from pydantic.typing import NoArgAnyCallable
-from pydantic.utils import smart_deepcopy
+from pydantic.utils import IMMUTABLE_NON_COLLECTIONS_TYPES, smart_deepcopy
 
 from strawberry.experimental.pydantic.exceptions import (
     AutoFieldsNotInBaseModelError,
@@ -69,13 +69,20 @@ def sort_creation_fields(
     first
     """
 
-    def has_default(model_field: DataclassCreationFields) -> bool:
-        """Check if field has defaults."""
-        return (model_field.field.default is not dataclasses.MISSING) or (
+    # a stable partition is enough here, the relative order of the fields in
+    # each group is kept
+    without_defaults: List[DataclassCreationFields] = []
+    with_defaults: List[DataclassCreationFields] = []
+
+    for model_field in fields:
+        if (model_field.field.default is not dataclasses.MISSING) or (
             model_field.field.default_factory is not dataclasses.MISSING
-        )
+        ):
+            with_defaults.append(model_field)
+        else:
+            without_defaults.append(model_field)
 
-    return sorted(fields, key=has_default)
+    return without_defaults + with_defaults
 
 
 def get_default_factory_for_field(
@@ -113,6 +120,11 @@ def get_default_factory_for_field(
     # if we have a default, we should return it
 
     if has_default:
+        # immutable values can be shared between instances, so there's no need
+        # to copy them every time the factory is called
+        if default.__class__ in IMMUTABLE_NON_COLLECTIONS_TYPES:
+            return lambda: default
+
         return lambda: smart_deepcopy(default)
 
     # if we don't have default or default_factory, but the field is not required,
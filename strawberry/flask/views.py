@@ -43,6 +43,9 @@ class GraphQLView(View):
     def process_result(self, result: ExecutionResult) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
+        return json.dumps(response_data)
+
     def dispatch_request(self) -> Response:
         method = request.method
         content_type = request.content_type or ""
@@ -89,7 +92,7 @@ class GraphQLView(View):
             return Response(e.as_http_error_reason(method), 400)
 
         response_data = self.process_result(result)
-        response.set_data(json.dumps(response_data))
+        response.set_data(self.encode_json(response_data))
 
         return response
 
@@ -141,6 +144,6 @@ class AsyncGraphQLView(GraphQLView):
             return Response(e.as_http_error_reason(method), 400)
 
         response_data = self.process_result(result)
-        response.set_data(json.dumps(response_data))
+        response.set_data(self.encode_json(response_data))
 
         return response
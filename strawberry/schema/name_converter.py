@@ -113,8 +113,6 @@ class NameConverter:
         return "".join(names) + generic_type_name
 
     def get_from_type(self, type_: Union[StrawberryType, type]) -> str:
-        from strawberry.union import StrawberryUnion
-
         if isinstance(type_, LazyType):
             name = type_.type_name
         elif isinstance(type_, EnumDefinition):
@@ -32,6 +32,7 @@ from graphql import (
     GraphQLOutputType,
     GraphQLResolveInfo,
     GraphQLScalarType,
+    GraphQLType,
     GraphQLUnionType,
     Undefined,
     ValueNode,
@@ -100,6 +101,11 @@ class GraphQLCoreConverter:
         self.config = config
         self.scalar_registry = scalar_registry
 
+        # wrapping types only hold the type they wrap, so a single instance can
+        # be shared by all the fields and arguments that use the same type
+        self._list_types: Dict[GraphQLType, GraphQLList] = {}
+        self._non_null_types: Dict[GraphQLNullableType, GraphQLNonNull] = {}
+
     def from_argument(self, argument: StrawberryArgument) -> GraphQLArgument:
         argument_type = cast(GraphQLInputType, self.from_maybe_optional(argument.type))
         default_value = Undefined if argument.default is UNSET else argument.default
@@ -331,7 +337,13 @@ class GraphQLCoreConverter:
     def from_list(self, type_: StrawberryList) -> GraphQLList:
         of_type = self.from_maybe_optional(type_.of_type)
 
-        return GraphQLList(of_type)
+        list_type = self._list_types.get(of_type)
+
+        if list_type is None:
+            list_type = GraphQLList(of_type)
+            self._list_types[of_type] = list_type
+
+        return list_type
 
     def from_object(self, object_type: TypeDefinition) -> GraphQLObjectType:
         # TODO: Use StrawberryObjectType when it's implemented in another PR
@@ -378,9 +390,19 @@ class GraphQLCoreConverter:
     def from_resolver(
         self, field: StrawberryField
     ) -> Callable:  # TODO: Take StrawberryResolver
+        # the strawberry Info is only created when something can receive it,
+        # otherwise we'd allocate one for every resolved field (including the
+        # ones that just read an attribute) and throw it away
+        needs_info = (
+            bool(field.permission_classes)
+            or (field.base_resolver is not None and field.base_resolver.has_info_arg)
+            # custom fields might use the info in their own get_result
+            or type(field).get_result is not StrawberryField.get_result
+        )
+
         def _get_arguments(
             source: Any,
-            info: Info,
+            info: Optional[Info],
             kwargs: Dict[str, Any],
         ) -> Tuple[List[Any], Dict[str, Any]]:
             kwargs = convert_arguments(
@@ -443,27 +465,46 @@ class GraphQLCoreConverter:
                 _field=field,
             )
 
-        def _get_result(_source: Any, info: Info, **kwargs):
+        def _get_result(_source: Any, info: Optional[Info], **kwargs):
             field_args, field_kwargs = _get_arguments(
                 source=_source, info=info, kwargs=kwargs
             )
 
+            # info is only None when neither the resolver nor get_result use it
             return field.get_result(
-                _source, info=info, args=field_args, kwargs=field_kwargs
+                _source, info=cast(Info, info), args=field_args, kwargs=field_kwargs
             )
 
         def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+            if not needs_info:
+                return _get_result(_source, None, **kwargs)
+
             strawberry_info = _strawberry_info_from_graphql(info)
             _check_permissions(_source, strawberry_info, kwargs)
 
             return _get_result(_source, strawberry_info, **kwargs)
 
         async def _async_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+            if not needs_info:
+                return await await_maybe(_get_result(_source, None, **kwargs))
+
             strawberry_info = _strawberry_info_from_graphql(info)
             await _check_permissions_async(_source, strawberry_info, kwargs)
 
             return await await_maybe(_get_result(_source, strawberry_info, **kwargs))
 
+        # fields without a resolver that don't need the info (and so have no
+        # permissions or custom get_result) just read the attribute from the
+        # source, so we can skip all the machinery above
+        if not field.base_resolver and not needs_info:
+            python_name = field.python_name
+
+            def _attribute_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+                return getattr(_source, python_name)
+
+            _attribute_resolver._is_default = True  # type: ignore
+            return _attribute_resolver
+
         if field.is_async:
             _async_resolver._is_default = not field.base_resolver  # type: ignore
             return _async_resolver
@@ -514,7 +555,14 @@ class GraphQLCoreConverter:
         elif isinstance(type_, StrawberryOptional):
             return self.from_type(type_.of_type)
         else:
-            return GraphQLNonNull(self.from_type(type_))
+            of_type = self.from_type(type_)
+            non_null_type = self._non_null_types.get(of_type)
+
+            if non_null_type is None:
+                non_null_type = GraphQLNonNull(of_type)
+                self._non_null_types[of_type] = non_null_type
+
+            return non_null_type
 
     def from_type(self, type_: Union[StrawberryType, type]) -> GraphQLNullableType:
         if compat.is_generic(type_):
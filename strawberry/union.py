@@ -1,7 +1,13 @@
 import itertools
+import operator
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
     List,
     Mapping,
     NoReturn,
@@ -13,9 +19,12 @@ from typing import (
     cast,
 )
 
+from backports.cached_property import cached_property
+
 from graphql import (
     GraphQLAbstractType,
     GraphQLNamedType,
+    GraphQLObjectType,
     GraphQLResolveInfo,
     GraphQLType,
     GraphQLTypeResolver,
@@ -28,12 +37,167 @@ from strawberry.exceptions import (
     UnallowedReturnTypeForUnion,
     WrongReturnTypeForUnion,
 )
-from strawberry.type import StrawberryOptional, StrawberryType
+from strawberry.type import StrawberryOptional, StrawberryType, StrawberryTypeVar
+from strawberry.types.types import TypeDefinition
 
 
 if TYPE_CHECKING:
     from strawberry.schema.types.concrete_type import TypeMap
-    from strawberry.types.types import TypeDefinition
+
+
+# The fields of a generic type annotated with one of its type vars, along with a
+# function returning the key used to find the concrete type of a root in the
+# dispatch table, see `_build_dispatch_table`.
+TypeVarFields = Tuple[Tuple[str, TypeVar], ...]
+DispatchKeyGetter = Callable[[Any], Hashable]
+
+
+def _get_concrete_type(value: Any) -> Any:
+    concrete_type = type(value)
+
+    # TODO: uniform type var map, at the moment we map object types
+    # to their class (not to TypeDefinition) while we map enum to
+    # the EnumDefinition class. This is why we do this check here:
+    return getattr(concrete_type, "_enum_definition", concrete_type)
+
+
+def _get_dispatch_key(concrete_types: Tuple[Any, ...]) -> Hashable:
+    # Most generic types have a single type var, in which case we use the type
+    # itself as the key to avoid building a tuple on every resolution
+    if len(concrete_types) == 1:
+        return concrete_types[0]
+
+    return concrete_types
+
+
+def _get_type_var_fields(
+    type_definition: TypeDefinition,
+) -> Tuple[TypeVarFields, DispatchKeyGetter]:
+    type_var_fields = tuple(
+        (field.name, field.type.type_var)
+        for field in type_definition.fields
+        if isinstance(field.type, StrawberryTypeVar)
+    )
+    field_names = [field_name for field_name, _ in type_var_fields]
+
+    # `attrgetter` only returns a tuple when fetching more than one attribute
+    get_key: DispatchKeyGetter
+    if len(field_names) > 1:
+        get_values = operator.attrgetter(*field_names)
+
+        def get_key(root: Any) -> Hashable:
+            return tuple(map(_get_concrete_type, get_values(root)))
+
+    elif field_names:
+        get_value = operator.attrgetter(field_names[0])
+
+        def get_key(root: Any) -> Hashable:
+            return _get_concrete_type(get_value(root))
+
+    else:
+
+        def get_key(root: Any) -> Hashable:
+            return ()
+
+    return type_var_fields, get_key
+
+
+def _build_dispatch_table(
+    type_map: "TypeMap",
+    root_type_definition: TypeDefinition,
+    type_var_fields: TypeVarFields,
+) -> Dict[Hashable, GraphQLType]:
+    dispatch_table: Dict[Hashable, GraphQLType] = {}
+
+    for concrete_type in type_map.values():
+        definition = concrete_type.definition
+        if not isinstance(definition, TypeDefinition):
+            continue
+        if definition.concrete_of is not root_type_definition:
+            continue
+
+        key = _get_dispatch_key(
+            tuple(
+                definition.type_var_map.get(type_var) for _, type_var in type_var_fields
+            )
+        )
+
+        try:
+            dispatch_table.setdefault(key, concrete_type.implementation)
+        except TypeError:
+            # Unhashable types are handled by `_find_generic_implementation`
+            continue
+
+    return dispatch_table
+
+
+def _find_generic_implementation(
+    type_map: "TypeMap",
+    root_type_definition: TypeDefinition,
+    type_var_fields: TypeVarFields,
+    concrete_types: tuple,
+) -> Optional[GraphQLType]:
+    # Pair each type var with the type found on the root once, rather than for each
+    # of the types we check
+    found_types = [
+        (type_var, concrete_type)
+        for (_, type_var), concrete_type in zip(type_var_fields, concrete_types)
+    ]
+
+    # Iterate over all of our known types and find the first concrete type
+    # that implements the type
+    for possible_concrete_type in type_map.values():
+        possible_type = possible_concrete_type.definition
+        if not isinstance(possible_type, TypeDefinition):
+            continue
+
+        if possible_type is not root_type_definition:
+            if possible_type.concrete_of is not root_type_definition:
+                continue
+
+            # Check the type map of the concrete type against the types
+            # actually found on the root. Missing type vars are ignored
+            type_var_map = possible_type.type_var_map
+            if any(
+                type_var_map.get(type_var, concrete_type) is not concrete_type
+                for type_var, concrete_type in found_types
+            ):
+                continue
+
+        return possible_concrete_type.implementation
+
+    return None
+
+
+GenericResolver = Callable[[Any], Optional[GraphQLType]]
+
+
+def _build_generic_resolver(
+    type_map: "TypeMap", type_definition: TypeDefinition
+) -> GenericResolver:
+    # Everything that only depends on the class is computed upfront, so that the
+    # returned function only has to look at the values of the root. It must not
+    # reference the class (which its definition does), as it is cached in a mapping
+    # weakly keyed by the class
+
+    type_var_fields, get_key = _get_type_var_fields(type_definition)
+    dispatch_table = _build_dispatch_table(type_map, type_definition, type_var_fields)
+
+    def _resolve_generic_type(root: Any) -> Optional[GraphQLType]:
+        implementation = dispatch_table.get(get_key(root))
+
+        if implementation is None:
+            concrete_types = tuple(
+                _get_concrete_type(getattr(root, field_name))
+                for field_name, _ in type_var_fields
+            )
+            implementation = _find_generic_implementation(
+                type_map, root._type_definition, type_var_fields, concrete_types
+            )
+
+        return implementation
+
+    return _resolve_generic_type
 
 
 class StrawberryUnion(StrawberryType):
@@ -73,8 +237,10 @@ class StrawberryUnion(StrawberryType):
         # https://github.com/strawberry-graphql/strawberry/pull/1455
         raise InvalidUnionType(other)
 
-    @property
+    @cached_property
     def types(self) -> Tuple[StrawberryType, ...]:
+        # Resolving the annotations of generic types creates a new concrete type
+        # every time, so we only do it once per union
         return tuple(
             cast(StrawberryType, annotation.resolve())
             for annotation in self.type_annotations
@@ -136,16 +302,61 @@ class StrawberryUnion(StrawberryType):
         raise ValueError("Cannot use union type directly")
 
     def get_type_resolver(self, type_map: "TypeMap") -> GraphQLTypeResolver:
+        # The members of the GraphQL union and the complete type map are only known
+        # once the schema has been created, so we set these up on the first resolution
+        allowed_types: FrozenSet[GraphQLObjectType] = frozenset()
+        # Maps the definition of the members of the union to the name of their GraphQL
+        # type, so that non generic roots are resolved with a single lookup
+        type_names: Dict[TypeDefinition, str] = {}
+        # Unions without generic members can never be resolved from a generic root,
+        # so they can skip checking whether the root is generic altogether
+        has_generic_members = False
+        # What we learned about the class of each root we have seen: for generic
+        # classes a function finding the GraphQL type of their instances, None for
+        # classes that are not generic. Weak keys let classes created at runtime be
+        # collected
+        generic_resolvers: "weakref.WeakKeyDictionary[type, Optional[GenericResolver]]"
+        generic_resolvers = weakref.WeakKeyDictionary()
+
+        def _setup(type_: GraphQLUnionType) -> None:
+            nonlocal allowed_types, type_names, has_generic_members
+
+            # Other threads may be resolving this union at the same time: everything
+            # is built in locals and `allowed_types` is published last, as a non
+            # empty `allowed_types` tells them the setup is complete
+            union_types = frozenset(type_.types)
+            union_type_names: Dict[TypeDefinition, str] = {}
+            union_has_generic_members = False
+
+            for concrete_type in type_map.values():
+                definition = concrete_type.definition
+                if not isinstance(definition, TypeDefinition):
+                    continue
+
+                implementation = concrete_type.implementation
+                if implementation not in union_types:
+                    continue
+
+                assert isinstance(implementation, GraphQLObjectType)  # For mypy
+                union_type_names[definition] = implementation.name
+
+                if definition.concrete_of is not None:
+                    union_has_generic_members = True
+
+            type_names = union_type_names
+            has_generic_members = union_has_generic_members
+            allowed_types = union_types
+
         def _resolve_union_type(
             root: Any, info: GraphQLResolveInfo, type_: GraphQLAbstractType
         ) -> str:
             assert isinstance(type_, GraphQLUnionType)
 
-            from strawberry.types.types import TypeDefinition
+            root_type_definition = getattr(root, "_type_definition", None)
 
-            # If the type given is not an Object type, try resolving using `is_type_of`
-            # defined on the union's inner types
-            if not hasattr(root, "_type_definition"):
+            if root_type_definition is None:
+                # If the type given is not an Object type, try resolving using
+                # `is_type_of` defined on the union's inner types
                 for inner_type in type_.types:
                     if inner_type.is_type_of is not None and inner_type.is_type_of(
                         root, info
@@ -153,26 +364,41 @@ class StrawberryUnion(StrawberryType):
                         return inner_type.name
 
                 # Couldn't resolve using `is_type_of``
-                raise WrongReturnTypeForUnion(info.field_name, str(type(root)))
+                raise WrongReturnTypeForUnion(info.field_name, type(root))
+
+            if not allowed_types:
+                _setup(type_)
+
+            root_type = type(root)
+
+            if has_generic_members:
+                try:
+                    resolve_generic_type = generic_resolvers[root_type]
+                except KeyError:
+                    resolve_generic_type = (
+                        _build_generic_resolver(type_map, root_type_definition)
+                        if root_type_definition.is_generic
+                        else None
+                    )
+                    generic_resolvers[root_type] = resolve_generic_type
+            else:
+                resolve_generic_type = None
 
-            return_type: Optional[GraphQLType]
+            if resolve_generic_type is None:
+                type_name = type_names.get(root_type_definition)
+                if type_name is None:
+                    raise UnallowedReturnTypeForUnion(
+                        info.field_name, root_type, allowed_types
+                    )
 
-            # Iterate over all of our known types and find the first concrete type that
-            # implements the type
-            for possible_concrete_type in type_map.values():
-                possible_type = possible_concrete_type.definition
-                if not isinstance(possible_type, TypeDefinition):
-                    continue
-                if possible_type.is_implemented_by(root):
-                    return_type = possible_concrete_type.implementation
-                    break
-            else:
-                return_type = None
+                return type_name
+
+            return_type = resolve_generic_type(root)
 
             # Make sure the found type is expected by the Union
-            if return_type is None or return_type not in type_.types:
+            if return_type is None or return_type not in allowed_types:
                 raise UnallowedReturnTypeForUnion(
-                    info.field_name, str(type(root)), set(type_.types)
+                    info.field_name, root_type, allowed_types
                 )
 
             # Return the name of the type. Returning the actual type is now deprecated
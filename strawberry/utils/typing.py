@@ -4,6 +4,10 @@ from typing import _GenericAlias  # type: ignore
 from typing import Any, Callable, ClassVar, Generic, Tuple, Type, TypeVar, Union
 
 
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+
 def is_list(annotation: Type) -> bool:
     """Returns True if annotation is a List"""
 
@@ -18,11 +22,8 @@ def is_union(annotation: Type) -> bool:
     # this check is needed because unions declared with the new syntax `A | B`
     # don't have a `__origin__` property on them, but they are instances of
     # `UnionType`, which is only available in Python 3.10+
-    if sys.version_info >= (3, 10):
-        from types import UnionType
-
-        if isinstance(annotation, UnionType):
-            return True
+    if sys.version_info >= (3, 10) and isinstance(annotation, UnionType):
+        return True
 
     # unions declared as Union[A, B] fall through to this check, even on python 3.10+
 
@@ -1,6 +1,7 @@
 import strawberry
 from aiohttp import hdrs, web
 from strawberry.aiohttp.views import GraphQLView
+from strawberry.http import GraphQLHTTPResponse
 from strawberry.types import ExecutionResult, Info
 
 
@@ -66,6 +67,31 @@ async def test_custom_process_result(aiohttp_client):
     assert data == {}
 
 
+async def test_custom_encode_json(aiohttp_client):
+    class CustomGraphQLView(GraphQLView):
+        def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
+            return '{"custom": true}'
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def abc(self) -> str:
+            return "ABC"
+
+    schema = strawberry.Schema(query=Query)
+
+    app = web.Application()
+    app.router.add_route("*", "/graphql", CustomGraphQLView(schema=schema))
+    client = await aiohttp_client(app)
+
+    query = "{ abc }"
+    response = await client.post("/graphql", json={"query": query})
+    data = await response.json()
+
+    assert response.status == 200
+    assert data == {"custom": True}
+
+
 async def test_setting_cookies_via_context(aiohttp_client):
     @strawberry.type
     class Query:
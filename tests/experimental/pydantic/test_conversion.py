@@ -1,13 +1,14 @@
 import base64
+import gc
 import re
+import weakref
 from enum import Enum
-from typing import Any, Dict, List, NewType, Optional, Union, cast
+from typing import Any, Dict, List, NewType, Optional, Union
 
 import pytest
 
-from pydantic import BaseConfig, BaseModel, Field
+from pydantic import BaseConfig, BaseModel, Field, create_model
 from pydantic.fields import ModelField
-from pydantic.typing import NoArgAnyCallable
 
 import strawberry
 from strawberry.experimental.pydantic.exceptions import (
@@ -25,7 +26,26 @@ from strawberry.types.types import TypeDefinition
 from strawberry.unset import UNSET
 
 
-def test_can_use_type_standalone():
+MISSING_PASSWORD_FIELD_MESSAGE = re.escape(
+    "UserType defines ['password'] with strawberry.auto."
+    " Field(s) not present in User BaseModel."
+)
+
+
+# pydantic models that several tests wrap in their own strawberry types. They
+# are never nested in other models, so it doesn't matter which strawberry type
+# was registered on them last
+class AliasedUserModel(BaseModel):
+    age_: int = Field(..., alias="age")
+    password: Optional[str]
+
+
+class PasswordUserModel(BaseModel):
+    password: Optional[str]
+
+
+@pytest.fixture(scope="module")
+def user_pair():
     class User(BaseModel):
         age: int
         password: Optional[str]
@@ -35,22 +55,35 @@ def test_can_use_type_standalone():
         age: strawberry.auto
         password: strawberry.auto
 
-    user = UserType(age=1, password="abc")
-
-    assert user.age == 1
-    assert user.password == "abc"
+    return User, UserType
 
 
-def test_can_convert_pydantic_type_to_strawberry():
+@pytest.fixture(scope="module")
+def user_input_pair():
     class User(BaseModel):
         age: int
         password: Optional[str]
 
-    @strawberry.experimental.pydantic.type(User)
-    class UserType:
+    @strawberry.experimental.pydantic.input(User)
+    class UserInput:
         age: strawberry.auto
         password: strawberry.auto
 
+    return User, UserInput
+
+
+def test_can_use_type_standalone(user_pair):
+    _, UserType = user_pair
+
+    user = UserType(age=1, password="abc")
+
+    assert user.age == 1
+    assert user.password == "abc"
+
+
+def test_can_convert_pydantic_type_to_strawberry(user_pair):
+    User, UserType = user_pair
+
     origin_user = User(age=1, password="abc")
     user = UserType.from_pydantic(origin_user)
 
@@ -64,10 +97,7 @@ def test_cannot_convert_pydantic_type_to_strawberry_missing_field():
 
     with pytest.raises(
         AutoFieldsNotInBaseModelError,
-        match=re.escape(
-            "UserType defines ['password'] with strawberry.auto."
-            " Field(s) not present in User BaseModel."
-        ),
+        match=MISSING_PASSWORD_FIELD_MESSAGE,
     ):
 
         @strawberry.experimental.pydantic.type(User)
@@ -88,10 +118,7 @@ def test_cannot_convert_pydantic_type_to_strawberry_property_auto():
 
     with pytest.raises(
         AutoFieldsNotInBaseModelError,
-        match=re.escape(
-            "UserType defines ['password'] with strawberry.auto."
-            " Field(s) not present in User BaseModel."
-        ),
+        match=MISSING_PASSWORD_FIELD_MESSAGE,
     ):
 
         @strawberry.experimental.pydantic.type(User)
@@ -121,16 +148,12 @@ def test_can_convert_pydantic_type_to_strawberry_property():
 
 
 def test_can_convert_alias_pydantic_field_to_strawberry():
-    class UserModel(BaseModel):
-        age_: int = Field(..., alias="age")
-        password: Optional[str]
-
-    @strawberry.experimental.pydantic.type(UserModel)
+    @strawberry.experimental.pydantic.type(AliasedUserModel)
     class User:
         age_: strawberry.auto
         password: strawberry.auto
 
-    origin_user = UserModel(age=1, password="abc")
+    origin_user = AliasedUserModel(age=1, password="abc")
     user = User.from_pydantic(origin_user)
 
     assert user.age_ == 1
@@ -138,17 +161,13 @@ def test_can_convert_alias_pydantic_field_to_strawberry():
 
 
 def test_convert_alias_name():
-    class UserModel(BaseModel):
-        age_: int = Field(..., alias="age")
-        password: Optional[str]
-
     @strawberry.experimental.pydantic.type(
-        UserModel, all_fields=True, use_pydantic_alias=True
+        AliasedUserModel, all_fields=True, use_pydantic_alias=True
     )
     class User:
         ...
 
-    origin_user = UserModel(age=1, password="abc")
+    origin_user = AliasedUserModel(age=1, password="abc")
     user = User.from_pydantic(origin_user)
     assert user.age_ == 1
     definition = User._type_definition
@@ -157,17 +176,13 @@ def test_convert_alias_name():
 
 
 def test_do_not_convert_alias_name():
-    class UserModel(BaseModel):
-        age_: int = Field(..., alias="age")
-        password: Optional[str]
-
     @strawberry.experimental.pydantic.type(
-        UserModel, all_fields=True, use_pydantic_alias=False
+        AliasedUserModel, all_fields=True, use_pydantic_alias=False
     )
     class User:
         ...
 
-    origin_user = UserModel(age=1, password="abc")
+    origin_user = AliasedUserModel(age=1, password="abc")
     user = User.from_pydantic(origin_user)
     assert user.age_ == 1
     definition = User._type_definition
@@ -211,6 +226,27 @@ def test_can_convert_falsy_values_to_strawberry():
     assert user.password == ""
 
 
+def test_converted_type_can_be_garbage_collected():
+    def create_type():
+        class UserModel(BaseModel):
+            age: int
+
+        # the converters of `friend` reference the class they are stored on
+        @strawberry.experimental.pydantic.type(UserModel)
+        class User:
+            age: strawberry.auto
+            friend: Optional["User"] = None
+
+        User.from_pydantic(UserModel(age=1))
+
+        return weakref.ref(User)
+
+    user_type_ref = create_type()
+    gc.collect()
+
+    assert user_type_ref() is None
+
+
 def test_can_convert_pydantic_type_to_strawberry_with_private_field():
     class UserModel(BaseModel):
         age: int
@@ -231,28 +267,8 @@ def test_can_convert_pydantic_type_to_strawberry_with_private_field():
     assert definition.fields[0].type == int
 
 
-def test_can_convert_pydantic_type_with_nested_data_to_strawberry():
-    class WorkModel(BaseModel):
-        name: str
-
-    @strawberry.experimental.pydantic.type(WorkModel)
-    class Work:
-        name: strawberry.auto
-
-    class UserModel(BaseModel):
-        work: WorkModel
-
-    @strawberry.experimental.pydantic.type(UserModel)
-    class User:
-        work: strawberry.auto
-
-    origin_user = UserModel(work=WorkModel(name="Ice Cream inc"))
-    user = User.from_pydantic(origin_user)
-
-    assert user.work.name == "Ice Cream inc"
-
-
-def test_can_convert_pydantic_type_with_list_of_nested_data_to_strawberry():
+@pytest.fixture(scope="module")
+def nested_user_pairs():
     class WorkModel(BaseModel):
         name: str
 
@@ -260,69 +276,6 @@ def test_can_convert_pydantic_type_with_list_of_nested_data_to_strawberry():
     class Work:
         name: strawberry.auto
 
-    class UserModel(BaseModel):
-        work: List[WorkModel]
-
-    @strawberry.experimental.pydantic.type(UserModel)
-    class User:
-        work: strawberry.auto
-
-    origin_user = UserModel(
-        work=[
-            WorkModel(name="Ice Cream inc"),
-            WorkModel(name="Wall Street"),
-        ]
-    )
-    user = User.from_pydantic(origin_user)
-
-    assert user.work == [Work(name="Ice Cream inc"), Work(name="Wall Street")]
-
-
-def test_can_convert_pydantic_type_with_list_of_nested_int_to_strawberry():
-    class UserModel(BaseModel):
-        hours: List[int]
-
-    @strawberry.experimental.pydantic.type(UserModel)
-    class User:
-        hours: strawberry.auto
-
-    origin_user = UserModel(
-        hours=[
-            8,
-            9,
-            10,
-        ]
-    )
-    user = User.from_pydantic(origin_user)
-
-    assert user.hours == [8, 9, 10]
-
-
-def test_can_convert_pydantic_type_with_matrix_list_of_nested_int_to_strawberry():
-    class UserModel(BaseModel):
-        hours: List[List[int]]
-
-    @strawberry.experimental.pydantic.type(UserModel)
-    class User:
-        hours: strawberry.auto
-
-    origin_user = UserModel(
-        hours=[
-            [8, 10],
-            [9, 11],
-            [10, 12],
-        ]
-    )
-    user = User.from_pydantic(origin_user)
-
-    assert user.hours == [
-        [8, 10],
-        [9, 11],
-        [10, 12],
-    ]
-
-
-def test_can_convert_pydantic_type_with_matrix_list_of_nested_model_to_strawberry():
     class HourModel(BaseModel):
         hour: int
 
@@ -330,45 +283,71 @@ def test_can_convert_pydantic_type_with_matrix_list_of_nested_model_to_strawberr
     class Hour:
         hour: strawberry.auto
 
-    class UserModel(BaseModel):
-        hours: List[List[HourModel]]
+    def create_user_pair(annotation, value, expected):
+        # a user model with a single field, so each case only converts its own shape
+        UserModel = create_model("UserModel", field=(annotation, ...))
 
-    @strawberry.experimental.pydantic.type(UserModel)
-    class User:
-        hours: strawberry.auto
+        @strawberry.experimental.pydantic.type(UserModel)
+        class User:
+            field: strawberry.auto
 
-    origin_user = UserModel(
-        hours=[
-            [
-                HourModel(hour=1),
-                HourModel(hour=2),
-            ],
+        return UserModel(field=value), User, expected
+
+    return {
+        "nested_data": create_user_pair(
+            WorkModel,
+            WorkModel(name="Ice Cream inc"),
+            Work(name="Ice Cream inc"),
+        ),
+        "list_of_nested_data": create_user_pair(
+            List[WorkModel],
+            [WorkModel(name="Ice Cream inc"), WorkModel(name="Wall Street")],
+            [Work(name="Ice Cream inc"), Work(name="Wall Street")],
+        ),
+        "list_of_nested_int": create_user_pair(
+            List[int],
+            [8, 9, 10],
+            [8, 9, 10],
+        ),
+        "matrix_list_of_nested_int": create_user_pair(
+            List[List[int]],
+            [[8, 10], [9, 11], [10, 12]],
+            [[8, 10], [9, 11], [10, 12]],
+        ),
+        "matrix_list_of_nested_model": create_user_pair(
+            List[List[HourModel]],
             [
-                HourModel(hour=3),
-                HourModel(hour=4),
+                [HourModel(hour=1), HourModel(hour=2)],
+                [HourModel(hour=3), HourModel(hour=4)],
+                [HourModel(hour=5), HourModel(hour=6)],
             ],
             [
-                HourModel(hour=5),
-                HourModel(hour=6),
+                [Hour(hour=1), Hour(hour=2)],
+                [Hour(hour=3), Hour(hour=4)],
+                [Hour(hour=5), Hour(hour=6)],
             ],
-        ]
-    )
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [
+        "nested_data",
+        "list_of_nested_data",
+        "list_of_nested_int",
+        "matrix_list_of_nested_int",
+        "matrix_list_of_nested_model",
+    ],
+)
+def test_can_convert_pydantic_type_with_nested_data_to_strawberry(
+    nested_user_pairs, shape
+):
+    origin_user, User, expected = nested_user_pairs[shape]
+
     user = User.from_pydantic(origin_user)
 
-    assert user.hours == [
-        [
-            Hour(hour=1),
-            Hour(hour=2),
-        ],
-        [
-            Hour(hour=3),
-            Hour(hour=4),
-        ],
-        [
-            Hour(hour=5),
-            Hour(hour=6),
-        ],
-    ]
+    assert user.field == expected
 
 
 def test_can_convert_pydantic_type_to_strawberry_with_union():
@@ -557,15 +536,12 @@ def test_can_convert_pydantic_type_to_strawberry_with_interface():
 
 
 def test_can_convert_pydantic_type_to_strawberry_with_additional_fields():
-    class UserModel(BaseModel):
-        password: Optional[str]
-
-    @strawberry.experimental.pydantic.type(UserModel)
+    @strawberry.experimental.pydantic.type(PasswordUserModel)
     class User:
         age: int
         password: strawberry.auto
 
-    origin_user = UserModel(password="abc")
+    origin_user = PasswordUserModel(password="abc")
     user = User.from_pydantic(origin_user, extra={"age": 1})
 
     assert user.age == 1
@@ -577,15 +553,12 @@ def test_can_convert_pydantic_type_to_strawberry_with_additional_nested_fields()
     class Work:
         name: str
 
-    class UserModel(BaseModel):
-        password: Optional[str]
-
-    @strawberry.experimental.pydantic.type(UserModel)
+    @strawberry.experimental.pydantic.type(PasswordUserModel)
     class User:
         work: Work
         password: strawberry.auto
 
-    origin_user = UserModel(password="abc")
+    origin_user = PasswordUserModel(password="abc")
     user = User.from_pydantic(origin_user, extra={"work": {"name": "Ice inc"}})
 
     assert user.work.name == "Ice inc"
@@ -597,15 +570,12 @@ def test_can_convert_pydantic_type_to_strawberry_with_additional_list_nested_fie
     class Work:
         name: str
 
-    class UserModel(BaseModel):
-        password: Optional[str]
-
-    @strawberry.experimental.pydantic.type(UserModel)
+    @strawberry.experimental.pydantic.type(PasswordUserModel)
     class User:
         work: List[Work]
         password: strawberry.auto
 
-    origin_user = UserModel(password="abc")
+    origin_user = PasswordUserModel(password="abc")
     user = User.from_pydantic(
         origin_user,
         extra={
@@ -737,15 +707,8 @@ def test_can_convert_pydantic_type_to_strawberry_with_optional_nested_value():
     assert user.names is None
 
 
-def test_can_convert_input_types_to_pydantic():
-    class User(BaseModel):
-        age: int
-        password: Optional[str]
-
-    @strawberry.experimental.pydantic.input(User)
-    class UserInput:
-        age: strawberry.auto
-        password: strawberry.auto
+def test_can_convert_input_types_to_pydantic(user_input_pair):
+    _, UserInput = user_input_pair
 
     data = UserInput(1, None)
     user = data.to_pydantic()
@@ -754,15 +717,8 @@ def test_can_convert_input_types_to_pydantic():
     assert user.password is None
 
 
-def test_can_convert_input_types_to_pydantic_default_values():
-    class User(BaseModel):
-        age: int
-        password: Optional[str] = None
-
-    @strawberry.experimental.pydantic.input(User)
-    class UserInput:
-        age: strawberry.auto
-        password: strawberry.auto
+def test_can_convert_input_types_to_pydantic_default_values(user_input_pair):
+    _, UserInput = user_input_pair
 
     data = UserInput(age=1)
     user = data.to_pydantic()
@@ -891,41 +847,47 @@ def test_sort_creation_fields():
 
 
 def test_get_default_factory_for_field():
-    def _get_field(default: Any = UNSET, default_factory: Any = UNSET) -> ModelField:
-        return ModelField(
-            name="a",
-            type_=str,
-            class_validators={},
-            model_config=BaseConfig,
-            default=default,
-            default_factory=default_factory,
-        )
+    field_kwargs: Dict[str, Any] = dict(
+        name="a", type_=str, class_validators={}, model_config=BaseConfig
+    )
 
     # should return UNSET when both defaults are UNSET
-    field = _get_field()
+    field = ModelField(**field_kwargs, default=UNSET, default_factory=UNSET)
 
     assert get_default_factory_for_field(field) is UNSET
 
     def factory_func():
         return "strawberry"
 
-    field = _get_field(default_factory=factory_func)
+    field = ModelField(**field_kwargs, default=UNSET, default_factory=factory_func)
 
     # should return the default_factory unchanged
     assert get_default_factory_for_field(field) is factory_func
 
     mutable_default = [123, "strawberry"]
 
-    field = _get_field(mutable_default)
+    field = ModelField(**field_kwargs, default=mutable_default, default_factory=UNSET)
 
     created_factory = get_default_factory_for_field(field)
-    created_factory = cast(NoArgAnyCallable, created_factory)
 
     # should return a factory that copies the default parameter
+    assert callable(created_factory)
     assert created_factory() == mutable_default
     assert created_factory() is not mutable_default
 
-    field = _get_field(default=mutable_default, default_factory=factory_func)
+    immutable_default = "strawberry"
+
+    field = ModelField(**field_kwargs, default=immutable_default, default_factory=UNSET)
+
+    created_factory = get_default_factory_for_field(field)
+
+    # should return a factory that returns the immutable default as is
+    assert callable(created_factory)
+    assert created_factory() is immutable_default
+
+    field = ModelField(
+        **field_kwargs, default=mutable_default, default_factory=factory_func
+    )
 
     with pytest.raises(
         BothDefaultAndDefaultFactoryDefinedError,
@@ -3,6 +3,7 @@ import json
 import strawberry
 from flask import Flask, Response, request
 from strawberry.flask.views import GraphQLView as BaseGraphQLView
+from strawberry.http import GraphQLHTTPResponse
 from strawberry.types import ExecutionResult, Info
 
 from .app import create_app
@@ -155,6 +156,37 @@ def test_custom_process_result():
         assert data == {}
 
 
+def test_custom_encode_json():
+    class CustomGraphQLView(BaseGraphQLView):
+        def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
+            return '{"custom": true}'
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def abc(self) -> str:
+            return "ABC"
+
+    schema = strawberry.Schema(query=Query)
+
+    app = Flask(__name__)
+    app.debug = True
+
+    app.add_url_rule(
+        "/graphql",
+        view_func=CustomGraphQLView.as_view("graphql_view", schema=schema),
+    )
+
+    with app.test_client() as client:
+        query = "{ abc }"
+
+        response = client.get("/graphql", json={"query": query})
+        data = json.loads(response.data.decode())
+
+        assert response.status_code == 200
+        assert data == {"custom": True}
+
+
 def test_context_with_response():
     @strawberry.type
     class Query:
@@ -5,6 +5,7 @@ from typing import List, Optional
 import pytest
 
 import strawberry
+from strawberry.field import StrawberryField
 from strawberry.types import Info
 from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
 from strawberry.unset import UNSET
@@ -347,3 +348,20 @@ def test_field_nodes_deprecation():
 
     assert not result.errors
     assert result.data["field"] == 0
+
+
+def test_custom_field_get_result_receives_info():
+    class FieldNameField(StrawberryField):
+        def get_result(self, source, info, args, kwargs):
+            return info.field_name
+
+    @strawberry.type
+    class Query:
+        name: str = FieldNameField()
+
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ name }", root_value=Query(name="unused"))
+
+    assert not result.errors
+    assert result.data == {"name": "name"}
@@ -100,3 +100,27 @@ def test_custom_execution_context():
         "hello": "World",
         "extra": "data",
     }
+
+
+def test_wrapping_types_are_shared_between_fields():
+    @strawberry.type
+    class Query:
+        name: str
+        nickname: str
+        tags: List[str]
+        aliases: List[str]
+
+        @strawberry.field
+        def greet(self, name: str) -> str:
+            return f"Hi {name}"
+
+    schema = strawberry.Schema(query=Query)
+
+    query_type = schema._schema.query_type
+    assert query_type
+
+    fields = query_type.fields
+
+    assert fields["name"].type is fields["nickname"].type
+    assert fields["tags"].type is fields["aliases"].type
+    assert fields["greet"].args["name"].type is fields["name"].type
@@ -1,7 +1,8 @@
 import sys
+import threading
 from dataclasses import dataclass
 from textwrap import dedent
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 import pytest
 
@@ -187,6 +188,99 @@ def test_types_not_included_in_the_union_are_rejected():
     )
 
 
+def test_list_of_union_with_many_types():
+    @strawberry.type
+    class A:
+        a: int
+
+    @strawberry.type
+    class B:
+        b: int
+
+    @strawberry.type
+    class C:
+        c: int
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self) -> List[Union[A, B, C]]:
+            return [A(a=1), C(c=3), B(b=2), A(a=4)]
+
+    schema = strawberry.Schema(query=Query)
+
+    query = """{
+        items {
+            __typename
+            ... on A { a }
+            ... on B { b }
+            ... on C { c }
+        }
+    }"""
+
+    result = schema.execute_sync(query)
+
+    assert not result.errors
+    assert result.data["items"] == [
+        {"__typename": "A", "a": 1},
+        {"__typename": "C", "c": 3},
+        {"__typename": "B", "b": 2},
+        {"__typename": "A", "a": 4},
+    ]
+
+
+def test_union_type_resolver_is_thread_safe():
+    types = tuple(
+        strawberry.type(type(f"Type{i}", (), {"__annotations__": {"value": int}}))
+        for i in range(200)
+    )
+    Result = strawberry.union("Result", types)
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def result(self) -> Result:
+            return types[0](value=0)
+
+    schema = strawberry.Schema(query=Query)
+    type_map = schema.schema_converter.type_map
+    union_type = schema._schema.get_type("Result")
+    info = type("Info", (), {"field_name": "result"})()
+    roots = [type_(value=0) for type_ in types]
+
+    # Switch threads as often as possible, so that they interleave during the setup
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        _resolve_concurrently(Result, type_map, union_type, info, roots)
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def _resolve_concurrently(union, type_map, union_type, info, roots):
+    for _ in range(20):
+        # A new resolver has not been set up yet, so all the threads race to do it
+        resolve_type = union.get_type_resolver(type_map)
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def resolve():
+            barrier.wait()
+            try:
+                for root in reversed(roots):
+                    resolve_type(root, info, union_type)
+            except Exception as error:  # pragma: no cover
+                errors.append(error)
+
+        threads = [threading.Thread(target=resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+
+
 def test_named_union():
     @strawberry.type
     class A: